@@ -1,6 +1,7 @@
 # SPDX-FileCopyrightText: 2019 Brent Rubell for Adafruit Industries
 #
 # SPDX-License-Identifier: MIT
+# pylint: disable=too-many-lines
 
 """
 `adafruit_io`
@@ -23,7 +24,7 @@ import json
 import re
 
 try:
-    from typing import List, Any, Callable, Optional
+    from typing import Any, Callable, Iterable, Optional
 except ImportError:
     pass
 
@@ -37,7 +38,30 @@ from adafruit_io.adafruit_io_errors import (
 __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_AdafruitIO.git"
 
-CLIENT_HEADERS = {"User-Agent": "AIO-CircuitPython/{0}".format(__version__)}
+# Maximum number of parsed feed topics kept by IO_MQTT
+_TOPIC_CACHE_SIZE = 16
+
+# Keys of the time service's struct.json response, in struct_time order
+_TIME_STRUCT_KEYS = (
+    "year",
+    "mon",
+    "mday",
+    "hour",
+    "min",
+    "sec",
+    "wday",
+    "yday",
+    "isdst",
+)
+
+# Serialize request bodies without whitespace where json.dumps supports it
+try:
+    json.dumps({}, separators=(",", ":"))
+    _JSON_DUMPS_KWARGS = {"separators": (",", ":")}
+except TypeError:  # older CircuitPython json.dumps has no separators argument
+    _JSON_DUMPS_KWARGS = {}
+
+CLIENT_HEADERS = {"User-Agent": f"AIO-CircuitPython/{__version__}"}
 
 
 def validate_feed_key(feed_key: str):
@@ -67,7 +91,7 @@ def validate_n_values(n_values: int):
         )
 
 
-class IO_MQTT:
+class IO_MQTT:  # pylint: disable=too-many-instance-attributes
     """
     Client for interacting with Adafruit IO MQTT API.
     https://io.adafruit.com/api/docs/mqtt.html#adafruit-io-mqtt-api
@@ -77,14 +101,13 @@ class IO_MQTT:
 
     # pylint: disable=protected-access
     def __init__(self, mqtt_client):
-        # Check for MiniMQTT client
-        mqtt_client_type = str(type(mqtt_client))
-        if "MQTT" in mqtt_client_type:
-            self._client = mqtt_client
-        else:
-            raise TypeError(
-                "This class requires a MiniMQTT client object, please create one."
-            )
+        # Check for a MiniMQTT compatible client
+        for method in ("connect", "subscribe", "publish", "loop"):
+            if not hasattr(mqtt_client, method):
+                raise TypeError(
+                    "This class requires a MiniMQTT client object, please create one."
+                )
+        self._client = mqtt_client
         # Adafruit IO MQTT API MUST require a username
         try:
             self._user = self._client._username
@@ -92,6 +115,9 @@ class IO_MQTT:
             raise TypeError(
                 "Adafruit IO requires a username, please set one in MiniMQTT"
             ) from err
+        # Topic prefixes for the user's own feeds and groups
+        self._feed_prefix = self._user + "/f/"
+        self._group_prefix = self._user + "/g/"
         # User-defined MQTT callback methods must be init'd to None
         self.on_connect = None
         self.on_disconnect = None
@@ -107,6 +133,9 @@ class IO_MQTT:
         self._client.on_unsubscribe = self._on_unsubscribe_mqtt
         self._client.on_publish = self._on_publish_mqtt
         self._connected = False
+        self._clean_session = True
+        # Feed names of recently parsed feed topics, keyed by topic
+        self._topic_cache = {}
 
     def __enter__(self):
         return self
@@ -115,18 +144,36 @@ class IO_MQTT:
         self.disconnect()
 
     def reconnect(self):
-        """Attempts to reconnect to the Adafruit IO MQTT Broker."""
+        """Attempts to reconnect to the Adafruit IO MQTT Broker.
+        Uses the clean_session setting given to connect().
+        """
         try:
-            self._client.reconnect()
+            if self._clean_session:
+                self._client.reconnect()
+            else:
+                # MiniMQTT's reconnect() always asks for a clean session,
+                # which would make the broker drop the persistent one
+                if self.is_connected:
+                    self._client.disconnect()
+                self._client.connect(clean_session=False)
         except Exception as err:
             raise AdafruitIO_MQTTError("Unable to reconnect to Adafruit IO.") from err
 
-    def connect(self):
+    def connect(self, clean_session: bool = True):
         """Connects to the Adafruit IO MQTT Broker.
         Must be called before any other API methods are called.
+        Does nothing if the client is already connected, so clean_session
+        is ignored then; call disconnect() first to change it.
+
+        :param bool clean_session: Set to False to ask the broker to keep this
+            client's session (subscriptions and queued QoS 1 messages) across
+            reconnects. Needs a fixed client_id on the MiniMQTT client.
         """
+        if self.is_connected:
+            return
+        self._clean_session = clean_session
         try:
-            self._client.connect()
+            self._client.connect(clean_session=clean_session)
         except Exception as err:
             raise AdafruitIO_MQTTError("Unable to connect to Adafruit IO.") from err
 
@@ -172,31 +219,40 @@ class IO_MQTT:
         :param str payload: MQTT payload data response from Adafruit IO.
         """
         if self.on_message is not None:
-            # Parse the MQTT topic string
-            topic_name = topic.split("/")
-            if topic_name[1] == "groups":
-                # Adafruit IO Group Feed(s)
-                feeds = []
-                messages = []
-                # Conversion of incoming group to a json response
-                payload = json.loads(payload)
-                for feed in payload["feeds"]:
-                    feeds.append(feed)
-                for msg in feeds:
-                    payload = payload["feeds"][msg]
-                    messages.append(payload)
-                topic_name = feeds
-                message = messages
-            elif topic_name[1] == "throttle":
-                raise AdafruitIO_ThrottleError(payload)
-            elif topic_name[0] == "time":
-                # Adafruit IO Time Topic
-                topic_name = topic_name[1]
+            cached_name = self._topic_cache.get(topic)
+            if cached_name is not None:
+                # Standard feed topic that was parsed before
+                topic_name = cached_name
                 message = payload
             else:
-                # Standard Adafruit IO Feed
-                topic_name = topic_name[2]
-                message = payload
+                # Parse the MQTT topic string
+                topic_name = topic.split("/", 3)
+                if topic_name[1] == "groups":
+                    # Adafruit IO Group Feed(s)
+                    feeds = []
+                    messages = []
+                    # Conversion of incoming group to a json response
+                    payload = json.loads(payload)
+                    for feed in payload["feeds"]:
+                        feeds.append(feed)
+                    for msg in feeds:
+                        payload = payload["feeds"][msg]
+                        messages.append(payload)
+                    topic_name = feeds
+                    message = messages
+                elif topic_name[1] == "throttle":
+                    raise AdafruitIO_ThrottleError(payload)
+                elif topic_name[0] == "time":
+                    # Adafruit IO Time Topic
+                    topic_name = topic_name[1]
+                    message = payload
+                else:
+                    # Standard Adafruit IO Feed
+                    topic_name = topic_name[2]
+                    message = payload
+                    if len(self._topic_cache) >= _TOPIC_CACHE_SIZE:
+                        self._topic_cache.clear()
+                    self._topic_cache[topic] = topic_name
         else:
             raise ValueError(
                 "You must define an on_message method before calling this callback."
@@ -233,9 +289,7 @@ class IO_MQTT:
         :param str callback_method: Name of callback method.
         """
         validate_feed_key(feed_key)
-        self._client.add_topic_callback(
-            "{0}/f/{1}".format(self._user, feed_key), callback_method
-        )
+        self._client.add_topic_callback(self._feed_prefix + feed_key, callback_method)
 
     def remove_feed_callback(self, feed_key: str):
         """Removes a previously registered callback method
@@ -247,11 +301,13 @@ class IO_MQTT:
         :param str feed_key: Adafruit IO feed key.
         """
         validate_feed_key(feed_key)
-        self._client.remove_topic_callback("{0}/f/{1}".format(self._user, feed_key))
+        self._client.remove_topic_callback(self._feed_prefix + feed_key)
 
     def loop(self, timeout=1):
         """Manually process messages from Adafruit IO.
         Call this method to check incoming subscription messages.
+        All messages that arrive within timeout are processed, and the
+        list of received packet types (or None) is returned.
 
         :param int timeout: Socket timeout, in seconds.
 
@@ -262,7 +318,23 @@ class IO_MQTT:
             while True:
                 io.loop()
         """
-        self._client.loop(timeout)
+        return self._client.loop(timeout)
+
+    def _feed_topics(self, feed_keys: Iterable, shared_user: Optional[str] = None):
+        """Validates feed keys and returns a list of their feed topics.
+
+        :param feed_keys: Adafruit IO Feed keys.
+        :param str shared_user: Owner of the Adafruit IO feeds, if shared.
+        """
+        if shared_user is None:
+            prefix = self._feed_prefix
+        else:
+            prefix = shared_user + "/f/"
+        topics = []
+        for feed_key in feed_keys:
+            validate_feed_key(feed_key)
+            topics.append(prefix + feed_key)
+        return topics
 
     # Subscriptions
     def subscribe(
@@ -274,7 +346,7 @@ class IO_MQTT:
         """Subscribes to your Adafruit IO feed or group.
         Can also subscribe to someone else's feed.
 
-        :param str feed_key: Adafruit IO Feed key.
+        :param str feed_key: Adafruit IO Feed key, or a list of feed keys.
         :param str group_key: Adafruit IO Group key.
         :param str shared_user: Owner of the Adafruit IO feed, required for shared feeds.
 
@@ -283,16 +355,27 @@ class IO_MQTT:
         .. code-block:: python
 
             client.subscribe('temperature')
+
+        Example of subscribing to multiple feeds with a single request.
+
+        .. code-block:: python
+
+            client.subscribe(['temperature', 'humidity'])
         """
-        if shared_user is not None and feed_key is not None:
+        if isinstance(feed_key, (list, tuple)):
+            if not feed_key:
+                raise AdafruitIO_MQTTError("Must provide a feed_key or group_key.")
+            topics = self._feed_topics(feed_key, shared_user)
+            self._client.subscribe([(topic, 0) for topic in topics])
+        elif shared_user is not None and feed_key is not None:
             validate_feed_key(feed_key)
-            self._client.subscribe("{0}/f/{1}".format(shared_user, feed_key))
+            self._client.subscribe(f"{shared_user}/f/{feed_key}")
         elif group_key is not None:
             validate_feed_key(group_key)
-            self._client.subscribe("{0}/g/{1}".format(self._user, group_key))
+            self._client.subscribe(self._group_prefix + group_key)
         elif feed_key is not None:
             validate_feed_key(feed_key)
-            self._client.subscribe("{0}/f/{1}".format(self._user, feed_key))
+            self._client.subscribe(self._feed_prefix + feed_key)
         else:
             raise AdafruitIO_MQTTError("Must provide a feed_key or group_key.")
 
@@ -300,35 +383,40 @@ class IO_MQTT:
         """Subscribes to your personal Adafruit IO /throttle topic.
         https://io.adafruit.com/api/docs/mqtt.html#mqtt-api-rate-limiting
         """
-        self._client.subscribe("%s/throttle" % self._user)
+        self._client.subscribe(f"{self._user}/throttle")
 
     def subscribe_to_errors(self):
         """Subscribes to your personal Adafruit IO /errors topic.
         Notifies you of errors relating to publish/subscribe calls.
         """
-        self._client.subscribe("%s/errors" % self._user)
+        self._client.subscribe(f"{self._user}/errors")
 
     def subscribe_to_randomizer(self, randomizer_id: int):
         """Subscribes to a random data stream created by the Adafruit IO Words service.
 
         :param int randomizer_id: Random word record you want data for.
         """
-        self._client.subscribe(
-            "{0}/integration/words/{1}".format(self._user, randomizer_id)
-        )
+        self._client.subscribe(f"{self._user}/integration/words/{randomizer_id}")
 
     def subscribe_to_weather(self, weather_record: int, forecast: str):
         """Subscribes to a weather forecast using the Adafruit IO PLUS weather
         service. This feature is only avaliable to Adafruit IO PLUS subscribers.
 
         :param int weather_record: Weather record you want data for.
-        :param str forecast: Forecast data you'd like to recieve.
+        :param str forecast: Forecast data you'd like to recieve, or a list of
+            forecasts to subscribe to with a single request.
+
+        Example of subscribing to several forecasts for one location.
+
+        .. code-block:: python
+
+            client.subscribe_to_weather(1234, ["current", "forecast_days_2"])
         """
-        self._client.subscribe(
-            "{0}/integration/weather/{1}/{2}".format(
-                self._user, weather_record, forecast
-            )
-        )
+        prefix = f"{self._user}/integration/weather/{weather_record}/"
+        if isinstance(forecast, (list, tuple)):
+            self._client.subscribe([(prefix + name, 0) for name in forecast])
+        else:
+            self._client.subscribe(prefix + forecast)
 
     def subscribe_to_time(self, time_type: str):
         """Adafruit IO provides some built-in MQTT topics for getting the current server time.
@@ -352,7 +440,7 @@ class IO_MQTT:
         """Unsubscribes from an Adafruit IO feed or group.
         Can also subscribe to someone else's feed.
 
-        :param str feed_key: Adafruit IO Feed key.
+        :param str feed_key: Adafruit IO Feed key, or a list of feed keys.
         :param str group_key: Adafruit IO Group key.
         :param str shared_user: Owner of the Adafruit IO feed, required for shared feeds.
 
@@ -362,32 +450,43 @@ class IO_MQTT:
 
             client.unsubscribe('temperature')
 
+        Example of unsubscribing from multiple feeds with a single request.
+
+        .. code-block:: python
+
+            client.unsubscribe(['temperature', 'humidity'])
+
         Example of unsubscribing from a shared feed.
 
         .. code-block:: python
 
             client.unsubscribe('temperature', shared_user='adabot')
         """
-        if shared_user is not None and feed_key is not None:
+        if isinstance(feed_key, (list, tuple)):
+            if not feed_key:
+                raise AdafruitIO_MQTTError("Must provide a feed_key or group_key.")
+            self._client.unsubscribe(self._feed_topics(feed_key, shared_user))
+        elif shared_user is not None and feed_key is not None:
             validate_feed_key(feed_key)
-            self._client.unsubscribe("{0}/f/{1}".format(shared_user, feed_key))
+            self._client.unsubscribe(f"{shared_user}/f/{feed_key}")
         elif group_key is not None:
             validate_feed_key(group_key)
-            self._client.unsubscribe("{0}/g/{1}".format(self._user, group_key))
+            self._client.unsubscribe(self._group_prefix + group_key)
         elif feed_key is not None:
             validate_feed_key(feed_key)
-            self._client.unsubscribe("{0}/f/{1}".format(self._user, feed_key))
+            self._client.unsubscribe(self._feed_prefix + feed_key)
         else:
             raise AdafruitIO_MQTTError("Must provide a feed_key or group_key.")
 
     # Publishing
     def publish_multiple(
-        self, feeds_and_data: List, timeout: int = 3, is_group: bool = False
+        self, feeds_and_data: Iterable, timeout: int = 3, is_group: bool = False
     ):
         """Publishes multiple data points to multiple feeds or groups with a variable
         timeout.
 
-        :param list feeds_and_data: List of tuples containing topic strings and data values.
+        :param feeds_and_data: Iterable (list, tuple or generator) of tuples
+                               containing topic strings and data values.
         :param int timeout: Delay between publishing data points to Adafruit IO, in seconds.
         :param bool is_group: Set to True if you're publishing to a group.
 
@@ -397,18 +496,24 @@ class IO_MQTT:
 
             client.publish_multiple([('humidity', 24.5), ('temperature', 54)])
         """
-        if isinstance(feeds_and_data, list):
-            feed_data = []
-            for topic, data in feeds_and_data:
-                feed_data.append((topic, data))
-        else:
-            raise AdafruitIO_MQTTError("This method accepts a list of tuples.")
-        for topic, data in feed_data:
-            if is_group:
-                self.publish(topic, data, is_group=True)
-            else:
-                self.publish(topic, data)
-            time.sleep(timeout)
+        try:
+            feed_data = iter(feeds_and_data)
+        except TypeError as err:
+            raise AdafruitIO_MQTTError(
+                "This method accepts an iterable of (topic, value) tuples."
+            ) from err
+        # Bind the methods used per item to locals once
+        publish = self.publish
+        sleep = time.sleep
+        for item in feed_data:
+            try:
+                topic, data = item
+            except (TypeError, ValueError) as err:
+                raise AdafruitIO_MQTTError(
+                    "This method accepts an iterable of (topic, value) tuples."
+                ) from err
+            publish(topic, data, is_group=is_group)
+            sleep(timeout)
 
     # pylint: disable=too-many-arguments
     def publish(
@@ -470,19 +575,22 @@ class IO_MQTT:
             io.publish("location-feed", data, metadata)
         """
         validate_feed_key(feed_key)
+        # Each call sends exactly one PUBLISH packet; a value with metadata
+        # goes to the feed's /csv topic as "value,lat,lon,ele".
         if is_group:
-            self._client.publish("{0}/g/{1}".format(self._user, feed_key), data)
+            self._client.publish(self._group_prefix + feed_key, data)
+            return
         if shared_user is not None:
-            self._client.publish("{0}/f/{1}".format(shared_user, feed_key), data)
+            topic = f"{shared_user}/f/{feed_key}"
+        else:
+            topic = self._feed_prefix + feed_key
         if metadata is not None:
-            if isinstance(data, int or float):
+            if isinstance(data, (int, float)):
                 data = str(data)
             csv_string = data + "," + metadata
-            self._client.publish(
-                "{0}/f/{1}/csv".format(self._user, feed_key), csv_string
-            )
+            self._client.publish(topic + "/csv", csv_string)
         else:
-            self._client.publish("{0}/f/{1}".format(self._user, feed_key), data)
+            self._client.publish(topic, data)
 
     def get(self, feed_key: str):
         """Calling this method will make Adafruit IO publish the most recent
@@ -498,7 +606,7 @@ class IO_MQTT:
             io.get('temperature')
         """
         validate_feed_key(feed_key)
-        self._client.publish("{0}/f/{1}/get".format(self._user, feed_key), "\0")
+        self._client.publish(self._feed_prefix + feed_key + "/get", "\0")
 
 
 class IO_HTTP:
@@ -508,18 +616,27 @@ class IO_HTTP:
 
     :param str adafruit_io_username: Adafruit IO Username
     :param str adafruit_io_key: Adafruit IO Key
-    :param requests: A passed adafruit_requests module.
+    :param requests: A passed adafruit_requests module. Pass a Session
+        (``adafruit_requests.Session`` or CPython ``requests.Session``) so
+        connections to Adafruit IO are reused between API calls.
     """
 
     def __init__(self, adafruit_io_username, adafruit_io_key, requests):
         self.username = adafruit_io_username
         self.key = adafruit_io_key
         self._http = requests
+        self._base_url = f"https://io.adafruit.com/api/v2/{self.username}/"
 
-        self._aio_headers = [
-            {"X-AIO-KEY": self.key, "Content-Type": "application/json"},
-            {"X-AIO-KEY": self.key},
-        ]
+        # Request headers never change, so they are only created once
+        self._post_headers = self._create_headers(
+            {"X-AIO-KEY": self.key, "Content-Type": "application/json"}
+        )
+        self._get_headers = self._create_headers({"X-AIO-KEY": self.key})
+        self._time_path = self._compose_path("integrations/time/struct.json")
+        # (timestamp, max_age, data) of GET responses requested with a max_age, by URL
+        self._get_cache = {}
+        # Feed records returned by create_and_get_feed with cache=True
+        self._feed_cache = {}
 
     @staticmethod
     def _create_headers(io_headers):
@@ -546,11 +663,15 @@ class IO_HTTP:
         """Checks HTTP status codes
         and raises errors.
         """
-        if response.status_code == 429:
-            raise AdafruitIO_ThrottleError
-        if response.status_code == 400:
-            raise AdafruitIO_RequestError(response)
-        if response.status_code >= 400:
+        status_code = response.status_code
+        if status_code >= 400:
+            if status_code == 429:
+                try:
+                    retry_after = int(response.headers["retry-after"])
+                except (KeyError, ValueError):
+                    # No header, or an HTTP-date rather than a delay in seconds
+                    retry_after = None
+                raise AdafruitIO_ThrottleError(retry_after=retry_after)
             raise AdafruitIO_RequestError(response)
 
     def _compose_path(self, path: str):
@@ -558,35 +679,55 @@ class IO_HTTP:
 
         :param str path: Adafruit IO API URL path.
         """
-        return "https://io.adafruit.com/api/v2/{0}/{1}".format(self.username, path)
+        return self._base_url + path
 
     # HTTP Requests
-    def _post(self, path: str, payload: Any):
+    def _post(self, path: str, payload: Any, parse_response: bool = True):
         """
         POST data to Adafruit IO
 
         :param str path: Formatted Adafruit IO URL from _compose_path
         :param json payload: JSON data to send to Adafruit IO
+        :param bool parse_response: Set False to skip decoding the response body
         """
+        json_data = None
         with self._http.post(
-            path, json=payload, headers=self._create_headers(self._aio_headers[0])
+            path,
+            data=json.dumps(payload, **_JSON_DUMPS_KWARGS),
+            headers=self._post_headers,
         ) as response:
             self._handle_error(response)
-            json_data = response.json()
+            if parse_response:
+                json_data = response.json()
 
         return json_data
 
-    def _get(self, path: str):
+    def _get(self, path: str, max_age: float = 0):
         """
         GET data from Adafruit IO
 
         :param str path: Formatted Adafruit IO URL from _compose_path
-        """
-        with self._http.get(
-            path, headers=self._create_headers(self._aio_headers[1])
-        ) as response:
+        :param float max_age: Time, in seconds, during which a response cached
+                              for this path is returned instead of requesting it
+        """
+        if self._get_cache:
+            now = time.monotonic()
+            # Drop responses older than the max_age they were cached with, so
+            # a large one (e.g. a forecast) doesn't stay in memory
+            for cached_path in [
+                key
+                for key, (fetched, cached_max_age, _) in self._get_cache.items()
+                if now - fetched >= cached_max_age
+            ]:
+                del self._get_cache[cached_path]
+            cached = self._get_cache.get(path)
+            if max_age > 0 and cached is not None and now - cached[0] < max_age:
+                return cached[2]
+        with self._http.get(path, headers=self._get_headers) as response:
             self._handle_error(response)
             json_data = response.json()
+        if max_age > 0:
+            self._get_cache[path] = (time.monotonic(), max_age, json_data)
         return json_data
 
     def _delete(self, path: str):
@@ -595,21 +736,21 @@ class IO_HTTP:
 
         :param str path: Formatted Adafruit IO URL from _compose_path
         """
-        with self._http.delete(
-            path, headers=self._create_headers(self._aio_headers[0])
-        ) as response:
+        with self._http.delete(path, headers=self._post_headers) as response:
             self._handle_error(response)
             json_data = response.json()
 
         return json_data
 
     # Data
+    # pylint: disable=too-many-arguments
     def send_data(
         self,
         feed_key: str,
         data: str,
         metadata: Optional[dict] = None,
         precision: Optional[int] = None,
+        return_record: bool = False,
     ):
         """
         Sends value data to a specified Adafruit IO feed.
@@ -618,9 +759,11 @@ class IO_HTTP:
         :param str data: Data to send to the Adafruit IO feed
         :param dict metadata: Optional metadata associated with the data
         :param int precision: Optional amount of precision points to send with floating point data
+        :param bool return_record: Set True to return the data record created by
+            Adafruit IO, instead of reading it back with receive_data
         """
         validate_feed_key(feed_key)
-        path = self._compose_path("feeds/{0}/data".format(feed_key))
+        path = self._compose_path("feeds/" + feed_key + "/data")
         if precision:
             try:
                 data = round(data, precision)
@@ -628,8 +771,37 @@ class IO_HTTP:
                 raise NotImplementedError(
                     "Precision requires a floating point value"
                 ) from err
-        payload = self._create_data(data, metadata)
-        self._post(path, payload)
+        if metadata:
+            payload = self._create_data(data, metadata)
+        else:
+            payload = {"value": data}
+        return self._post(path, payload, parse_response=return_record)
+
+    def make_publisher(self, feed_key: str):
+        """
+        Returns a function that sends a value to the specified Adafruit IO feed.
+        The feed key is validated and the request URL is composed only once,
+        which suits loops that keep sending to the same feed.
+
+        :param str feed_key: Adafruit IO feed key
+
+        Example of sending ADC readings to feed 'light':
+
+        .. code-block:: python
+
+            publish_light = io.make_publisher("light")
+            while True:
+                publish_light(adc.value)
+                time.sleep(30)
+        """
+        validate_feed_key(feed_key)
+        path = self._compose_path("feeds/" + feed_key + "/data")
+        post = self._post
+
+        def publish(data: Any):
+            post(path, {"value": data}, parse_response=False)
+
+        return publish
 
     def send_batch_data(self, feed_key: str, data_list: list):
         """
@@ -645,8 +817,8 @@ class IO_HTTP:
             data_list = type(data_list)((data._asdict() for data in data_list))
         if not all("value" in data for data in data_list):
             raise ValueError("Data list items must at least contain a 'value' key")
-        path = self._compose_path("feeds/{0}/data/batch".format(feed_key))
-        self._post(path, {"data": data_list})
+        path = self._compose_path("feeds/" + feed_key + "/data/batch")
+        self._post(path, {"data": data_list}, parse_response=False)
 
     def send_group_data(
         self, group_key: str, feeds_and_data: list, metadata: Optional[dict] = None
@@ -659,7 +831,7 @@ class IO_HTTP:
         :param dict metadata: Optional metadata for the data e.g. created_at, lat, lon, ele
         """
         validate_feed_key(group_key)
-        path = self._compose_path("groups/{0}/data".format(group_key))
+        path = self._compose_path("groups/" + group_key + "/data")
         if not isinstance(feeds_and_data, list):
             raise ValueError(
                 'This method accepts a list of dicts with "key" and "value".'
@@ -668,9 +840,9 @@ class IO_HTTP:
             if not isinstance(metadata, dict):
                 raise ValueError("Metadata must be a dictionary.")
             metadata.update({"feeds": feeds_and_data})
-            self._post(path, metadata)
+            self._post(path, metadata, parse_response=False)
         else:
-            self._post(path, {"feeds": feeds_and_data})
+            self._post(path, {"feeds": feeds_and_data}, parse_response=False)
 
     def receive_all_data(self, feed_key: str):
         """
@@ -680,7 +852,7 @@ class IO_HTTP:
         :param str feed_key: Adafruit IO feed key
         """
         validate_feed_key(feed_key)
-        path = self._compose_path("feeds/{0}/data".format(feed_key))
+        path = self._compose_path("feeds/" + feed_key + "/data")
         return self._get(path)
 
     def receive_n_data(self, feed_key: str, n_values: int):
@@ -693,18 +865,23 @@ class IO_HTTP:
         """
         validate_n_values(n_values)
         validate_feed_key(feed_key)
-        path = self._compose_path("feeds/{0}/data?limit={1}".format(feed_key, n_values))
+        path = self._compose_path(f"feeds/{feed_key}/data?limit={n_values}")
         return self._get(path)
 
-    def receive_data(self, feed_key: str):
+    def receive_data(self, feed_key: str, max_age: float = 0):
         """
         Return the most recent value for the specified feed.
 
         :param string feed_key: Adafruit IO feed key
+        :param float max_age: Optional time, in seconds, during which the value
+                              received by a previous call is returned again
+                              instead of requesting it from Adafruit IO
+
+        A value returned again is the same dict each time, so don't modify it.
         """
         validate_feed_key(feed_key)
-        path = self._compose_path("feeds/{0}/data/last".format(feed_key))
-        return self._get(path)
+        path = self._compose_path("feeds/" + feed_key + "/data/last")
+        return self._get(path, max_age)
 
     def delete_data(self, feed_key: str, data_id: str):
         """
@@ -714,7 +891,7 @@ class IO_HTTP:
         :param string data_id: Data point to delete from the feed
         """
         validate_feed_key(feed_key)
-        path = self._compose_path("feeds/{0}/data/{1}".format(feed_key, data_id))
+        path = self._compose_path(f"feeds/{feed_key}/data/{data_id}")
         return self._delete(path)
 
     # Groups
@@ -735,7 +912,7 @@ class IO_HTTP:
 
         :param str group_key: Adafruit IO Group Key
         """
-        path = self._compose_path("groups/{0}".format(group_key))
+        path = self._compose_path("groups/" + group_key)
         return self._delete(path)
 
     def get_group(self, group_key: str):
@@ -744,7 +921,7 @@ class IO_HTTP:
 
         :param str group_key: Adafruit IO Group Key
         """
-        path = self._compose_path("groups/{0}".format(group_key))
+        path = self._compose_path("groups/" + group_key)
         return self._get(path)
 
     def create_feed_in_group(self, group_key: str, feed_name: str):
@@ -753,7 +930,7 @@ class IO_HTTP:
         :param str group_key: Group name.
         :param str feed_name: Name of new feed.
         """
-        path = self._compose_path("groups/{0}/feeds".format(group_key))
+        path = self._compose_path("groups/" + group_key + "/feeds")
         payload = {"feed": {"name": feed_name}}
         return self._post(path, payload)
 
@@ -765,7 +942,7 @@ class IO_HTTP:
         :param str feed_key: Feed to add to the group
         """
         validate_feed_key(feed_key)
-        path = self._compose_path("groups/{0}/add".format(group_key))
+        path = self._compose_path("groups/" + group_key + "/add")
         payload = {"feed_key": feed_key}
         return self._post(path, payload)
 
@@ -779,9 +956,9 @@ class IO_HTTP:
         """
         validate_feed_key(feed_key)
         if detailed:
-            path = self._compose_path("feeds/{0}/details".format(feed_key))
+            path = self._compose_path("feeds/" + feed_key + "/details")
         else:
-            path = self._compose_path("feeds/{0}".format(feed_key))
+            path = self._compose_path("feeds/" + feed_key)
         return self._get(path)
 
     def create_new_feed(
@@ -802,12 +979,14 @@ class IO_HTTP:
         payload = {"name": feed_key, "description": feed_desc, "license": feed_license}
         return self._post(path, payload)
 
+    # pylint: disable=too-many-arguments
     def create_and_get_feed(
         self,
         feed_key: str,
         detailed: bool = False,
         feed_desc: Optional[str] = None,
         feed_license: Optional[str] = None,
+        cache: bool = False,
     ):
         """
         Attempts to return a feed; if the feed does not exist, it is created, and then returned.
@@ -816,14 +995,26 @@ class IO_HTTP:
         :param bool detailed: Returns a more verbose existing feed record
         :param str feed_desc: Optional description of feed to be created
         :param str feed_license: Optional feed license to be created
-        """
+        :param bool cache: Set True to remember the feed record, so later calls for the
+                           same feed with cache=True return it without a request. Fields
+                           such as last_value are then not updated, so only use it when
+                           just the feed's key is needed.
+        """
+        cache_key = (feed_key, detailed)
+        if cache:
+            feed = self._feed_cache.get(cache_key)
+            if feed is not None:
+                return feed
         try:
-            return self.get_feed(feed_key, detailed=detailed)
+            feed = self.get_feed(feed_key, detailed=detailed)
         except AdafruitIO_RequestError:
             self.create_new_feed(
                 feed_key, feed_desc=feed_desc, feed_license=feed_license
             )
-            return self.get_feed(feed_key, detailed=detailed)
+            feed = self.get_feed(feed_key, detailed=detailed)
+        if cache:
+            self._feed_cache[cache_key] = feed
+        return feed
 
     def delete_feed(self, feed_key: str):
         """
@@ -832,19 +1023,27 @@ class IO_HTTP:
         :param str feed_key: Valid feed key
         """
         validate_feed_key(feed_key)
-        path = self._compose_path("feeds/{0}".format(feed_key))
+        self._feed_cache.pop((feed_key, False), None)
+        self._feed_cache.pop((feed_key, True), None)
+        path = self._compose_path("feeds/" + feed_key)
         return self._delete(path)
 
     # Adafruit IO Connected Services
-    def receive_weather(self, weather_id: int):
+    def receive_weather(self, weather_id: int, max_age: float = 0):
         """
         Get data from the Adafruit IO Weather Forecast Service
         NOTE: This service is avaliable to Adafruit IO Plus subscribers only.
 
         :param int weather_id: ID for retrieving a specified weather record.
+        :param float max_age: Optional time, in seconds, during which the forecast
+                              received by a previous call is returned again
+                              instead of requesting it from Adafruit IO
+
+        A forecast returned again is the same dict each time, so don't modify it.
+        It is freed by the first request made after it is max_age seconds old.
         """
-        path = self._compose_path("integrations/weather/{0}".format(weather_id))
-        return self._get(path)
+        path = self._compose_path(f"integrations/weather/{weather_id}")
+        return self._get(path, max_age)
 
     def receive_random_data(self, generator_id: int):
         """
@@ -852,7 +1051,7 @@ class IO_HTTP:
 
         :param int generator_id: Specified randomizer record
         """
-        path = self._compose_path("integrations/words/{0}".format(generator_id))
+        path = self._compose_path(f"integrations/words/{generator_id}")
         return self._get(path)
 
     def get_user_info(self):
@@ -935,21 +1134,95 @@ class IO_HTTP:
 
         :param str timezone: Timezone to return time in, see https://io.adafruit.com/services/time
         """
-        path = self._compose_path("integrations/time/struct.json")
+        path = self._time_path
         if timezone is not None:
-            path += "?tz={0}".format(timezone)
+            path += f"?tz={timezone}"
         time_struct = self._get(path)
-        return time.struct_time(
-            # pylint: disable=line-too-long
-            (
-                time_struct["year"],
-                time_struct["mon"],
-                time_struct["mday"],
-                time_struct["hour"],
-                time_struct["min"],
-                time_struct["sec"],
-                time_struct["wday"],
-                time_struct["yday"],
-                time_struct["isdst"],
-            )
-        )
+        return time.struct_time(tuple(time_struct[key] for key in _TIME_STRUCT_KEYS))
+
+
+class BufferedFeed:
+    """
+    Collects data points for a single Adafruit IO feed and sends them with
+    one batch request, instead of one request per point.
+
+    :param IO_HTTP client: Adafruit IO HTTP client used to send the data.
+    :param str feed_key: Adafruit IO feed key.
+    :param int max_points: Number of buffered points that triggers a send.
+    :param float max_age: Time, in seconds, since the oldest buffered point
+                          was added that triggers a send.
+
+    Points without a ``created_at`` timestamp are stamped by Adafruit IO when
+    the batch arrives, so pass one in the metadata to keep each point's time.
+
+    max_age is checked when a point is appended and when poll() is called, so
+    call poll() from the main loop if points may arrive less often than that.
+    If a send fails, the points in that batch are dropped and the error is
+    raised, so the buffer never grows past max_points.
+
+    Example of buffering ADC readings and sending them in batches of 10:
+
+    .. code-block:: python
+
+        light_feed = BufferedFeed(io, "light", max_points=10)
+        while True:
+            light_feed.append(adc.value)
+            time.sleep(1)
+    """
+
+    def __init__(
+        self,
+        client: IO_HTTP,
+        feed_key: str,
+        max_points: int = 20,
+        max_age: float = 60,
+    ):
+        validate_feed_key(feed_key)
+        self._client = client
+        self.feed_key = feed_key
+        self.max_points = max_points
+        self.max_age = max_age
+        self._points = []
+        self._oldest = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        self.flush()
+
+    def __len__(self):
+        return len(self._points)
+
+    def append(self, data: Any, metadata: Optional[dict] = None):
+        """
+        Adds a data point to the buffer, sending the buffer if it is full
+        or its oldest point has reached max_age.
+
+        :param data: Data to send to the Adafruit IO feed
+        :param dict metadata: Optional metadata, e.g. created_at, lat, lon, ele
+        """
+        point = {"value": data}
+        if metadata:
+            point.update(metadata)
+        now = time.monotonic()
+        if not self._points:
+            self._oldest = now
+        self._points.append(point)
+        if len(self._points) >= self.max_points or now - self._oldest >= self.max_age:
+            self.flush()
+
+    def poll(self):
+        """Sends the buffered data points if the oldest has reached max_age."""
+        if self._points and time.monotonic() - self._oldest >= self.max_age:
+            self.flush()
+
+    def flush(self):
+        """
+        Sends any buffered data points to Adafruit IO. The points are removed
+        from the buffer even if the send fails.
+        """
+        if self._points:
+            points = self._points
+            self._points = []
+            self._client.send_batch_data(self.feed_key, points)
@@ -11,22 +11,34 @@ CircuitPython Adafruit IO Error Classes
 
 
 class AdafruitIO_ThrottleError(Exception):
-    """Adafruit IO request error class for rate-limiting."""
+    """Adafruit IO request error class for rate-limiting.
+
+    :param str message: Error message.
+    :param int retry_after: Seconds to wait before retrying, from the response's
+        Retry-After header, or None if the server did not send one.
+    """
+
+    def __init__(self, message="Adafruit IO request limit exceeded", retry_after=None):
+        super().__init__(message)
+        self.retry_after = retry_after
 
 
 class AdafruitIO_RequestError(Exception):
     """Adafruit IO request error class"""
 
     def __init__(self, response):
-        response_content = response.json()
-        error = response_content["error"]
-        super().__init__(
-            "Adafruit IO Error {0}: {1}".format(response.status_code, error)
-        )
+        try:
+            error = response.json()["error"]
+        except (ValueError, KeyError, TypeError):
+            # Error body is not the expected JSON, fall back to the HTTP reason
+            error = response.reason
+            if isinstance(error, (bytes, bytearray)):
+                error = error.decode("utf-8")
+        super().__init__(f"Adafruit IO Error {response.status_code}: {error}")
 
 
 class AdafruitIO_MQTTError(Exception):
     """Adafruit IO MQTT error class"""
 
     def __init__(self, response):
-        super().__init__("MQTT Error: {0}".format(response))
+        super().__init__(f"MQTT Error: {response}")
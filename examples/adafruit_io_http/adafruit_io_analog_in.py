@@ -4,6 +4,14 @@
 # Example of publishing the value of an ADC to Adafruit IO
 # adafruit_circuitpython_adafruitio with an esp32spi_socket
 import time
+import json
+
+try:
+    import alarm
+except ImportError:
+    # Not every board supports sleep alarms; fall back to time.sleep()
+    alarm = None
+import adafruit_datetime as datetime
 import board
 import busio
 from analogio import AnalogIn
@@ -11,7 +19,7 @@ from digitalio import DigitalInOut
 import adafruit_connection_manager
 from adafruit_esp32spi import adafruit_esp32spi
 import adafruit_requests
-from adafruit_io.adafruit_io import IO_HTTP, AdafruitIO_RequestError
+from adafruit_io.adafruit_io import IO_HTTP, AdafruitIO_RequestError, BufferedFeed
 
 # Add a secrets.py to your filesystem that has a dictionary called secrets with "ssid" and
 # "password" keys with your WiFi credentials. DO NOT share that file or commit it into Git or other
@@ -37,12 +45,16 @@ spi = busio.SPI(board.SCK, board.MOSI, board.MISO)
 esp = adafruit_esp32spi.ESP_SPIcontrol(spi, esp32_cs, esp32_ready, esp32_reset)
 
 print("Connecting to AP...")
+# Back off between failed attempts (1s, 2s, 4s, ... up to 60s) so an
+# unreachable AP doesn't keep the ESP32 and the SPI bus busy
+retry_delay = 1
 while not esp.is_connected:
     try:
         esp.connect_AP(secrets["ssid"], secrets["password"])
     except RuntimeError as e:
-        print("could not connect to AP, retrying: ", e)
-        continue
+        print("could not connect to AP, retrying in", retry_delay, "s: ", e)
+        time.sleep(retry_delay)
+        retry_delay = min(retry_delay * 2, 60)
 print("Connected to", str(esp.ssid, "utf-8"), "\tRSSI:", esp.rssi)
 
 # Initialize a requests session
@@ -59,22 +71,69 @@ aio_key = secrets["aio_key"]
 # Initialize an Adafruit IO HTTP API object
 io = IO_HTTP(aio_username, aio_key, requests)
 
-try:
-    # Get the 'light' feed from Adafruit IO
-    light_feed = io.get_feed("light")
-except AdafruitIO_RequestError:
-    # If no 'light' feed exists, create one
-    light_feed = io.create_new_feed("light")
+
+# Feed keys match the feed names, so the cache only lets later boots skip
+# the request that checks the feed exists (and creates it if not). Saving it
+# requires CIRCUITPY to be writable by code (see storage.remount).
+def get_feed_key(name, refresh=False):
+    try:
+        with open("/feed_cache.json", "r") as cache_file:
+            feed_cache = json.load(cache_file)
+    except (OSError, ValueError):
+        feed_cache = {}
+    if refresh or name not in feed_cache:
+        try:
+            feed_cache[name] = io.get_feed(name)["key"]
+        except AdafruitIO_RequestError:
+            feed_cache[name] = io.create_new_feed(name)["key"]
+        try:
+            with open("/feed_cache.json", "w") as cache_file:
+                json.dump(feed_cache, cache_file)
+        except OSError:
+            pass  # read-only filesystem, look the feed up again next time
+    return feed_cache[name]
+
+
+light_key = get_feed_key("light")
 
 # Set up an ADC
 adc = AnalogIn(board.A0)
 
+# Get the current time once, so buffered readings can be timestamped locally
+year, month, day, hour, minute, second, *_ = io.receive_time(timezone="UTC")
+start_time = datetime.datetime(year, month, day, hour, minute, second)
+start_monotonic = time.monotonic()
+
+# Collect readings and send them to the 'light' feed in batches of 10,
+# using one request per batch instead of one per reading
 SENSOR_DELAY = 30
+BATCH_SIZE = 10
+light_buffer = BufferedFeed(
+    io, light_key, max_points=BATCH_SIZE, max_age=BATCH_SIZE * SENSOR_DELAY
+)
+
 while True:
     light_value = adc.value
     print("ADC Value: ", light_value)
-    print("Sending to Adafruit IO...")
-    io.send_data(light_feed["key"], light_value)
-    print("Sent!")
-    # delay sending to Adafruit IO
-    time.sleep(SENSOR_DELAY)
+    created_at = start_time + datetime.timedelta(
+        seconds=time.monotonic() - start_monotonic
+    )
+    try:
+        light_buffer.append(light_value, {"created_at": created_at.isoformat()})
+    except AdafruitIO_RequestError:
+        # The cached 'light' feed may have been deleted. This batch is lost,
+        # the next one goes to the feed looked up (or created) again.
+        light_buffer.feed_key = get_feed_key("light", refresh=True)
+    else:
+        if not light_buffer:
+            print("Sent the last %d readings to Adafruit IO!" % BATCH_SIZE)
+    # delay reading the ADC again
+    if alarm:
+        # Idle the host MCU in light sleep instead of spinning in time.sleep().
+        # RAM is kept, so the buffered readings survive until the batch is sent.
+        time_alarm = alarm.time.TimeAlarm(
+            monotonic_time=time.monotonic() + SENSOR_DELAY
+        )
+        alarm.light_sleep_until_alarms(time_alarm)
+    else:
+        time.sleep(SENSOR_DELAY)
@@ -52,12 +52,14 @@ years, months, days, hours, minutes, seconds, *_ = io.receive_time("UTC")
 current_time = datetime.datetime(years, months, days, hours, minutes, seconds)
 print("Current time from Adafruit IO: ", current_time)
 
-# Create random values at different timestamps to send to the feed
+# Create random values at different timestamps to send to the feed,
+# one second apart and ending one second before the current time
 data = []
+one_second = datetime.timedelta(seconds=1)
+created_at = current_time - 5 * one_second
 for i in range(5):
     random_value = randint(0, 50)
     time_offset = i - 5
-    created_at = current_time + datetime.timedelta(seconds=time_offset)
     print(
         "Adding datapoint {0} (at T:{1}) to collection for batch-temperature feed...".format(
             random_value, time_offset
@@ -69,6 +71,7 @@ for i in range(5):
             "created_at": created_at.isoformat(),  # optional metadata like lat, lon, ele, etc
         }
     )
+    created_at += one_second
 
 # Send the data to the feed as a single batch
 io.send_batch_data(temperature_feed["key"], data)
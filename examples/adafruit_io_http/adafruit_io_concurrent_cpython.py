@@ -0,0 +1,56 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+# adafruit_circuitpython_adafruitio usage with CPython asyncio, issuing
+# independent HTTP API calls concurrently instead of one after another.
+import asyncio
+import os
+import requests
+from adafruit_io.adafruit_io import IO_HTTP, AdafruitIO_RequestError
+
+# Set the ADAFRUIT_AIO_USERNAME and ADAFRUIT_AIO_KEY environment variables
+# (visit io.adafruit.com if you need to create an account,
+# or if you need your Adafruit IO key.)
+aio_username = os.getenv("ADAFRUIT_AIO_USERNAME")
+aio_key = os.getenv("ADAFRUIT_AIO_KEY")
+if not aio_username or not aio_key:
+    raise RuntimeError("Set ADAFRUIT_AIO_USERNAME and ADAFRUIT_AIO_KEY first!")
+
+# A Session keeps connections to io.adafruit.com open between calls, so
+# only the first request per connection pays for the TLS handshake.
+# Size its pool for the number of requests issued at the same time.
+session = requests.Session()
+session.mount("https://", requests.adapters.HTTPAdapter(pool_maxsize=4))
+io = IO_HTTP(aio_username, aio_key, session)
+
+
+def get_or_create_feed(feed_key):
+    try:
+        return io.get_feed(feed_key)
+    except AdafruitIO_RequestError:
+        return io.create_new_feed(feed_key)
+
+
+async def main():
+    # Each blocking call runs in a worker thread, so the total wait is the
+    # slowest request rather than the sum of all of them
+    print("Fetching feeds and time from Adafruit IO concurrently...")
+    temperature_feed, humidity_feed, now = await asyncio.gather(
+        asyncio.to_thread(get_or_create_feed, "temperature"),
+        asyncio.to_thread(get_or_create_feed, "humidity"),
+        asyncio.to_thread(io.receive_time, "UTC"),
+    )
+    print("Current time from Adafruit IO: ", now)
+
+    # Each send_data call builds its own request body, so sends to different
+    # feeds can run in parallel threads without mixing up their values
+    print("Sending data to both feeds concurrently...")
+    await asyncio.gather(
+        asyncio.to_thread(io.send_data, temperature_feed["key"], 21.5),
+        asyncio.to_thread(io.send_data, humidity_feed["key"], 40),
+    )
+    print("Data sent!")
+
+
+asyncio.run(main())
+session.close()
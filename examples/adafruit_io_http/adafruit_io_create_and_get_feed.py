@@ -4,6 +4,7 @@
 Example using create_and_get_feed. Creates a new feed if it does not exist and sends to it, or
 sends to an existing feed once it has been created.
 """
+import time
 import ssl
 import adafruit_requests
 import socketpool
@@ -39,9 +40,13 @@ aio_key = secrets["aio_key"]
 # Initialize an Adafruit IO HTTP API object
 io = IO_HTTP(aio_username, aio_key, requests)
 
-# Create temperature variable using the CPU temperature and print the current value.
-temperature = microcontroller.cpu.temperature
-print("Current CPU temperature: {0} C".format(temperature))
+# Create and get feed once, then reuse its key for every send.
+temperature_feed = io.create_and_get_feed("cpu-temperature-feed")
+publish_temperature = io.make_publisher(temperature_feed["key"])
 
-# Create and get feed.
-io.send_data(io.create_and_get_feed("cpu-temperature-feed")["key"], temperature)
+while True:
+    # Create temperature variable using the CPU temperature and print the current value.
+    temperature = microcontroller.cpu.temperature
+    print("Current CPU temperature: {0} C".format(temperature))
+    publish_temperature(temperature)
+    time.sleep(30)
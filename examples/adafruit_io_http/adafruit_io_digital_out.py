@@ -4,6 +4,7 @@
 # Turn on and off a LED from your Adafruit IO Dashboard.
 # adafruit_circuitpython_adafruitio with an esp32spi_socket
 import time
+import json
 import board
 import busio
 from digitalio import DigitalInOut, Direction
@@ -36,12 +37,16 @@ spi = busio.SPI(board.SCK, board.MOSI, board.MISO)
 esp = adafruit_esp32spi.ESP_SPIcontrol(spi, esp32_cs, esp32_ready, esp32_reset)
 
 print("Connecting to AP...")
+# Back off between failed attempts (1s, 2s, 4s, ... up to 60s) so an
+# unreachable AP doesn't keep the ESP32 and the SPI bus busy
+retry_delay = 1
 while not esp.is_connected:
     try:
         esp.connect_AP(secrets["ssid"], secrets["password"])
     except RuntimeError as e:
-        print("could not connect to AP, retrying: ", e)
-        continue
+        print("could not connect to AP, retrying in", retry_delay, "s: ", e)
+        time.sleep(retry_delay)
+        retry_delay = min(retry_delay * 2, 60)
 print("Connected to", str(esp.ssid, "utf-8"), "\tRSSI:", esp.rssi)
 
 # Initialize a requests session
@@ -58,12 +63,30 @@ aio_key = secrets["aio_key"]
 # Initialize an Adafruit IO HTTP API object
 io = IO_HTTP(aio_username, aio_key, requests)
 
-try:
-    # Get the 'digital' feed from Adafruit IO
-    digital_feed = io.get_feed("digital")
-except AdafruitIO_RequestError:
-    # If no 'digital' feed exists, create one
-    digital_feed = io.create_new_feed("digital")
+
+# Feed keys match the feed names, so the cache only lets later boots skip
+# the request that checks the feed exists (and creates it if not). Saving it
+# requires CIRCUITPY to be writable by code (see storage.remount).
+def get_feed_key(name, refresh=False):
+    try:
+        with open("/feed_cache.json", "r") as cache_file:
+            feed_cache = json.load(cache_file)
+    except (OSError, ValueError):
+        feed_cache = {}
+    if refresh or name not in feed_cache:
+        try:
+            feed_cache[name] = io.get_feed(name)["key"]
+        except AdafruitIO_RequestError:
+            feed_cache[name] = io.create_new_feed(name)["key"]
+        try:
+            with open("/feed_cache.json", "w") as cache_file:
+                json.dump(feed_cache, cache_file)
+        except OSError:
+            pass  # read-only filesystem, look the feed up again next time
+    return feed_cache[name]
+
+
+digital_key = get_feed_key("digital")
 
 # Set up LED
 LED = DigitalInOut(board.D13)
@@ -72,7 +95,12 @@ LED.direction = Direction.OUTPUT
 while True:
     # Get data from 'digital' feed
     print("getting data from IO...")
-    feed_data = io.receive_data(digital_feed["key"])
+    try:
+        feed_data = io.receive_data(digital_key)
+    except AdafruitIO_RequestError:
+        # The 'digital' feed may have been deleted since its key was cached
+        digital_key = get_feed_key("digital", refresh=True)
+        feed_data = io.receive_data(digital_key)
 
     # Check if data is ON or OFF
     if int(feed_data["value"]) == 1:
@@ -4,6 +4,7 @@
 # Adafruit IO HTTP API - Group Interactions
 # Documentation: https://io.adafruit.com/api/docs/#groups
 # adafruit_circuitpython_adafruitio with an esp32spi_socket
+import time
 import adafruit_datetime as datetime
 import board
 import busio
@@ -50,12 +51,16 @@ spi = busio.SPI(board.SCK, board.MOSI, board.MISO)
 esp = adafruit_esp32spi.ESP_SPIcontrol(spi, esp32_cs, esp32_ready, esp32_reset)
 
 print("Connecting to AP...")
+# Back off between failed attempts (1s, 2s, 4s, ... up to 60s) so an
+# unreachable AP doesn't keep the ESP32 and the SPI bus busy
+retry_delay = 1
 while not esp.is_connected:
     try:
         esp.connect_AP(secrets["ssid"], secrets["password"])
     except RuntimeError as e:
-        print("could not connect to AP, retrying: ", e)
-        continue
+        print("could not connect to AP, retrying in", retry_delay, "s: ", e)
+        time.sleep(retry_delay)
+        retry_delay = min(retry_delay * 2, 60)
 print("Connected to", str(esp.ssid, "utf-8"), "\tRSSI:", esp.rssi)
 
 # If you are using a wifi based mcu use this instead of esp code above, remove the from
@@ -3,6 +3,8 @@
 
 # Adafruit IO HTTP API - Sending values with optional metadata
 # adafruit_circuitpython_adafruitio with an esp32spi_socket
+import json
+import time
 import board
 import busio
 from digitalio import DigitalInOut
@@ -35,12 +37,16 @@ spi = busio.SPI(board.SCK, board.MOSI, board.MISO)
 esp = adafruit_esp32spi.ESP_SPIcontrol(spi, esp32_cs, esp32_ready, esp32_reset)
 
 print("Connecting to AP...")
+# Back off between failed attempts (1s, 2s, 4s, ... up to 60s) so an
+# unreachable AP doesn't keep the ESP32 and the SPI bus busy
+retry_delay = 1
 while not esp.is_connected:
     try:
         esp.connect_AP(secrets["ssid"], secrets["password"])
     except RuntimeError as e:
-        print("could not connect to AP, retrying: ", e)
-        continue
+        print("could not connect to AP, retrying in", retry_delay, "s: ", e)
+        time.sleep(retry_delay)
+        retry_delay = min(retry_delay * 2, 60)
 print("Connected to", str(esp.ssid, "utf-8"), "\tRSSI:", esp.rssi)
 
 # Initialize a requests session
@@ -57,12 +63,30 @@ aio_key = secrets["aio_key"]
 # Initialize an Adafruit IO HTTP API object
 io = IO_HTTP(aio_username, aio_key, requests)
 
-try:
-    # Get the 'location' feed from Adafruit IO
-    location_feed = io.get_feed("location")
-except AdafruitIO_RequestError:
-    # If no 'location' feed exists, create one
-    location_feed = io.create_new_feed("location")
+
+# Feed keys match the feed names, so the cache only lets later boots skip
+# the request that checks the feed exists (and creates it if not). Saving it
+# requires CIRCUITPY to be writable by code (see storage.remount).
+def get_feed_key(name, refresh=False):
+    try:
+        with open("/feed_cache.json", "r") as cache_file:
+            feed_cache = json.load(cache_file)
+    except (OSError, ValueError):
+        feed_cache = {}
+    if refresh or name not in feed_cache:
+        try:
+            feed_cache[name] = io.get_feed(name)["key"]
+        except AdafruitIO_RequestError:
+            feed_cache[name] = io.create_new_feed(name)["key"]
+        try:
+            with open("/feed_cache.json", "w") as cache_file:
+                json.dump(feed_cache, cache_file)
+        except OSError:
+            pass  # read-only filesystem, look the feed up again next time
+    return feed_cache[name]
+
+
+location_key = get_feed_key("location")
 
 # Set data
 data_value = 42
@@ -72,5 +96,10 @@ metadata = {"lat": 40.726190, "lon": -74.005334, "ele": -6, "created_at": None}
 
 # Send data and location metadata to the 'location' feed
 print("Sending data and location metadata to IO...")
-io.send_data(location_feed["key"], data_value, metadata)
+try:
+    io.send_data(location_key, data_value, metadata)
+except AdafruitIO_RequestError:
+    # The cached feed may have been deleted, so look it up (or create it) again
+    location_key = get_feed_key("location", refresh=True)
+    io.send_data(location_key, data_value, metadata)
 print("Data sent!")
@@ -4,6 +4,12 @@
 # Example for using Adafruit IO's random data (randomizer) service
 # adafruit_circuitpython_adafruitio with an esp32spi_socket
 import time
+
+try:
+    import alarm
+except ImportError:
+    # Not every board supports sleep alarms; fall back to time.sleep()
+    alarm = None
 import board
 import busio
 from digitalio import DigitalInOut
@@ -36,12 +42,16 @@ spi = busio.SPI(board.SCK, board.MOSI, board.MISO)
 esp = adafruit_esp32spi.ESP_SPIcontrol(spi, esp32_cs, esp32_ready, esp32_reset)
 
 print("Connecting to AP...")
+# Back off between failed attempts (1s, 2s, 4s, ... up to 60s) so an
+# unreachable AP doesn't keep the ESP32 and the SPI bus busy
+retry_delay = 1
 while not esp.is_connected:
     try:
         esp.connect_AP(secrets["ssid"], secrets["password"])
     except RuntimeError as e:
-        print("could not connect to AP, retrying: ", e)
-        continue
+        print("could not connect to AP, retrying in", retry_delay, "s: ", e)
+        time.sleep(retry_delay)
+        retry_delay = min(retry_delay * 2, 60)
 print("Connected to", str(esp.ssid, "utf-8"), "\tRSSI:", esp.rssi)
 
 # Initialize a requests session
@@ -66,8 +76,26 @@ random_data_id = 1234
 
 while True:
     print("Fetching random data from Adafruit IO...")
-    random_data = io.receive_random_data(random_data_id)
-    print("Random Data: ", random_data["value"])
-    print("Data Seed: ", random_data["seed"])
+    # Retry a failed request a few times, waiting longer after each failure,
+    # before giving up until the next fetch
+    for attempt in range(3):
+        try:
+            random_data = io.receive_random_data(random_data_id)
+        except (OSError, ValueError, RuntimeError) as e:
+            print("Failed to get data, retrying\n", e)
+            time.sleep(0.5 * (1 << attempt))
+        else:
+            print("Random Data: ", random_data["value"])
+            print("Data Seed: ", random_data["seed"])
+            break
+    else:
+        print("Could not reach Adafruit IO, skipping this fetch")
     print("Waiting 1 minute to fetch new randomized data...")
-    time.sleep(60)
+    if alarm:
+        # Idle the host MCU in light sleep instead of spinning in time.sleep().
+        # RAM and the ESP32 connection are kept, so nothing needs to be
+        # set up again when it wakes.
+        time_alarm = alarm.time.TimeAlarm(monotonic_time=time.monotonic() + 60)
+        alarm.light_sleep_until_alarms(time_alarm)
+    else:
+        time.sleep(60)
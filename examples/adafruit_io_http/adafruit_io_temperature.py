@@ -4,6 +4,8 @@
 # Example of sending ADT7410 sensor temperature values to IO
 # adafruit_circuitpython_adafruitio with an esp32spi_socket
 import time
+import json
+import adafruit_datetime as datetime
 import board
 import busio
 from digitalio import DigitalInOut
@@ -11,7 +13,7 @@ import adafruit_connection_manager
 from adafruit_esp32spi import adafruit_esp32spi
 import adafruit_requests
 import adafruit_adt7410
-from adafruit_io.adafruit_io import IO_HTTP, AdafruitIO_RequestError
+from adafruit_io.adafruit_io import IO_HTTP, AdafruitIO_RequestError, BufferedFeed
 
 # Add a secrets.py to your filesystem that has a dictionary called secrets with "ssid" and
 # "password" keys with your WiFi credentials. DO NOT share that file or commit it into Git or other
@@ -37,12 +39,16 @@ spi = busio.SPI(board.SCK, board.MOSI, board.MISO)
 esp = adafruit_esp32spi.ESP_SPIcontrol(spi, esp32_cs, esp32_ready, esp32_reset)
 
 print("Connecting to AP...")
+# Back off between failed attempts (1s, 2s, 4s, ... up to 60s) so an
+# unreachable AP doesn't keep the ESP32 and the SPI bus busy
+retry_delay = 1
 while not esp.is_connected:
     try:
         esp.connect_AP(secrets["ssid"], secrets["password"])
     except RuntimeError as e:
-        print("could not connect to AP, retrying: ", e)
-        continue
+        print("could not connect to AP, retrying in", retry_delay, "s: ", e)
+        time.sleep(retry_delay)
+        retry_delay = min(retry_delay * 2, 60)
 print("Connected to", str(esp.ssid, "utf-8"), "\tRSSI:", esp.rssi)
 
 # Initialize a requests session
@@ -59,25 +65,78 @@ aio_key = secrets["aio_key"]
 # Initialize an Adafruit IO HTTP API object
 io = IO_HTTP(aio_username, aio_key, requests)
 
-try:
-    # Get the 'temperature' feed from Adafruit IO
-    temperature_feed = io.get_feed("temperature")
-except AdafruitIO_RequestError:
-    # If no 'temperature' feed exists, create one
-    temperature_feed = io.create_new_feed("temperature")
+
+# Feed keys match the feed names, so the cache only lets later boots skip
+# the request that checks the feed exists (and creates it if not). Saving it
+# requires CIRCUITPY to be writable by code (see storage.remount).
+def get_feed_key(name, refresh=False):
+    try:
+        with open("/feed_cache.json", "r") as cache_file:
+            feed_cache = json.load(cache_file)
+    except (OSError, ValueError):
+        feed_cache = {}
+    if refresh or name not in feed_cache:
+        try:
+            feed_cache[name] = io.get_feed(name)["key"]
+        except AdafruitIO_RequestError:
+            feed_cache[name] = io.create_new_feed(name)["key"]
+        try:
+            with open("/feed_cache.json", "w") as cache_file:
+                json.dump(feed_cache, cache_file)
+        except OSError:
+            pass  # read-only filesystem, look the feed up again next time
+    return feed_cache[name]
+
+
+temperature_key = get_feed_key("temperature")
 
 # Set up ADT7410 sensor
 i2c_bus = busio.I2C(board.SCL, board.SDA)
 adt = adafruit_adt7410.ADT7410(i2c_bus, address=0x48)
 adt.high_resolution = True
 
+# Get the current time once, so buffered readings can be timestamped locally
+year, month, day, hour, minute, second, *_ = io.receive_time(timezone="UTC")
+start_time = datetime.datetime(year, month, day, hour, minute, second)
+start_monotonic = time.monotonic()
+
+# Send readings in batches of 30 instead of one request each. A reading is
+# never held for more than a minute (BufferedFeed's default max_age).
+temperature_buffer = BufferedFeed(io, temperature_key, max_points=30)
+
+# Only readings that moved at least this much (in *C) since the last one
+# sent are buffered, so a steady temperature sends almost nothing. A reading
+# is still buffered every MAX_INTERVAL seconds to show the sensor is alive.
+TEMPERATURE_DELTA = 0.05
+MAX_INTERVAL = 300
+last_sent = None
+last_sent_time = 0
+
 while True:
-    temperature = adt.temperature
-    # set temperature value to two precision points
-    temperature = "%0.2f" % (temperature)
-
-    print("Current Temperature: {0}*C".format(temperature))
-    print("Sending to Adafruit IO...")
-    io.send_data(temperature_feed["key"], temperature)
-    print("Data sent!")
+    try:
+        temperature = adt.temperature
+        now = time.monotonic()
+        if (
+            last_sent is None
+            or abs(temperature - last_sent) >= TEMPERATURE_DELTA
+            or now - last_sent_time >= MAX_INTERVAL
+        ):
+            last_sent = temperature
+            last_sent_time = now
+            created_at = start_time + datetime.timedelta(seconds=now - start_monotonic)
+            # set temperature value to two precision points
+            temperature = "%0.2f" % (temperature)
+
+            print("Current Temperature: {0}*C".format(temperature))
+            # Sends the buffered readings to Adafruit IO once 30 have been collected
+            temperature_buffer.append(
+                temperature, {"created_at": created_at.isoformat()}
+            )
+        # Send readings that have waited a minute, so a steady temperature's
+        # occasional reading (and the heartbeat) is not held until the next one
+        temperature_buffer.poll()
+    except AdafruitIO_RequestError:
+        # The cached 'temperature' feed may have been deleted. The readings in
+        # the failed batch are lost, later ones go to the feed looked up again.
+        temperature_buffer.feed_key = get_feed_key("temperature", refresh=True)
     time.sleep(0.5)
@@ -36,11 +36,18 @@ requests = adafruit_requests.Session(pool, ssl.create_default_context())
 # Initialize an Adafruit IO HTTP API object
 io = IO_HTTP(aio_username, aio_key, requests)
 
+# Fetch the rate info once; the throttle limits below are derived from it
+# rather than calling get_throttle_limit() and get_remaining_throttle_limit(),
+# which would each request it again
+user_rates = io.get_user_rate_info()
+
 print("===============\nUser Rate info:\n===============")
-print("\n".join([f"{k:<30}\t=\t{v}" for (k, v) in io.get_user_rate_info().items()]))
+for k, v in user_rates.items():
+    print(f"{k:<30}\t=\t{v}")
 
-print(f"Throttle limit: {io.get_throttle_limit()}")
-print(f"Remaining throttle limit: {io.get_remaining_throttle_limit()}")
+throttle_limit = user_rates["data_rate_limit"]
+print(f"Throttle limit: {throttle_limit}")
+print(f"Remaining throttle limit: {throttle_limit - user_rates['active_data_rate']}")
 
 
 # # Uncomment these lines to retrieve all user info as one big json object:
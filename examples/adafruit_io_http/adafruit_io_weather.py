@@ -3,6 +3,7 @@
 
 # Example of using the Adafruit IO+ Weather Service
 # adafruit_circuitpython_adafruitio with an esp32spi_socket
+import time
 import board
 import busio
 from digitalio import DigitalInOut
@@ -35,12 +36,16 @@ spi = busio.SPI(board.SCK, board.MOSI, board.MISO)
 esp = adafruit_esp32spi.ESP_SPIcontrol(spi, esp32_cs, esp32_ready, esp32_reset)
 
 print("Connecting to AP...")
+# Back off between failed attempts (1s, 2s, 4s, ... up to 60s) so an
+# unreachable AP doesn't keep the ESP32 and the SPI bus busy
+retry_delay = 1
 while not esp.is_connected:
     try:
         esp.connect_AP(secrets["ssid"], secrets["password"])
     except RuntimeError as e:
-        print("could not connect to AP, retrying: ", e)
-        continue
+        print("could not connect to AP, retrying in", retry_delay, "s: ", e)
+        time.sleep(retry_delay)
+        retry_delay = min(retry_delay * 2, 60)
 print("Connected to", str(esp.ssid, "utf-8"), "\tRSSI:", esp.rssi)
 
 # Initialize a requests session
@@ -63,25 +68,30 @@ io = IO_HTTP(aio_username, aio_key, requests)
 # and copy over the location ID)
 location_id = 2127
 
-print("Getting forecast from IO...")
-# Fetch the specified record with current weather
-# and all available forecast information.
-forecast = io.receive_weather(location_id)
+# The weather service updates its forecast about every 20 minutes, so a
+# forecast received less than 20 minutes ago is reused instead of requested
+WEATHER_MAX_AGE = 20 * 60
 
-# Get today's forecast
-current_forecast = forecast["current"]
-print(
-    "It is {0} and {1}*F.".format(
-        current_forecast["summary"], current_forecast["temperature"]
+while True:
+    print("Getting forecast from IO...")
+    # Fetch the specified record with current weather
+    # and all available forecast information.
+    forecast = io.receive_weather(location_id, max_age=WEATHER_MAX_AGE)
+
+    # Get today's forecast
+    current_forecast = forecast["current"]
+    print(
+        f"It is {current_forecast['summary']} and {current_forecast['temperature']}*F."
     )
-)
-print("with a humidity of {0}%".format(current_forecast["humidity"] * 100))
+    print(f"with a humidity of {current_forecast['humidity'] * 100}%")
 
-# Get tomorrow's forecast
-tom_forecast = forecast["forecast_days_1"]
-print(
-    "\nTomorrow has a low of {0}*F and a high of {1}*F.".format(
-        tom_forecast["temperatureLow"], tom_forecast["temperatureHigh"]
+    # Get tomorrow's forecast
+    tom_forecast = forecast["forecast_days_1"]
+    print(
+        f"\nTomorrow has a low of {tom_forecast['temperatureLow']}*F"
+        f" and a high of {tom_forecast['temperatureHigh']}*F."
     )
-)
-print("with a humidity of {0}%".format(tom_forecast["humidity"] * 100))
+    print(f"with a humidity of {tom_forecast['humidity'] * 100}%")
+
+    # Show the forecast again in 5 minutes
+    time.sleep(5 * 60)
@@ -0,0 +1,102 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+# Example for using Adafruit IO's random data (randomizer) service over MQTT.
+# Adafruit IO pushes each new random value to the board, so it never has to
+# poll for one over HTTP.
+import json
+import os
+import ssl
+import socketpool
+import wifi
+import adafruit_minimqtt.adafruit_minimqtt as MQTT
+from adafruit_io.adafruit_io import IO_MQTT
+
+### WiFi ###
+
+# Add a secrets.py to your filesystem that has a dictionary called secrets with "ssid" and
+# "password" keys with your WiFi credentials. DO NOT share that file or commit it into Git or other
+# source control.
+# pylint: disable=no-name-in-module,wrong-import-order
+try:
+    if os.getenv("AIO_USERNAME") and os.getenv("AIO_KEY"):
+        secrets = {
+            "aio_username": os.getenv("AIO_USERNAME"),
+            "aio_key": os.getenv("AIO_KEY"),
+            "ssid": os.getenv("CIRCUITPY_WIFI_SSID"),
+            "password": os.getenv("CIRCUITPY_WIFI_PASSWORD"),
+        }
+    else:
+        from secrets import secrets
+except ImportError:
+    print(
+        "WiFi + Adafruit IO secrets are kept in secrets.py or settings.toml, please add them there!"
+    )
+    raise
+
+if not wifi.radio.connected:
+    print("Connecting to %s" % secrets["ssid"])
+    wifi.radio.connect(secrets["ssid"], secrets["password"])
+    print("Connected to %s!" % secrets["ssid"])
+
+# Random Data ID
+# (to obtain this value, visit
+# https://io.adafruit.com/services/words
+# and copy over the location ID)
+random_data_id = 1234
+
+
+# Define callback functions which will be called when certain events happen.
+# pylint: disable=unused-argument
+def connected(client):
+    # Subscribing here means the subscription is restored after a reconnect.
+    print("Connected to Adafruit IO!  Listening for random data...")
+    client.subscribe_to_randomizer(random_data_id)
+
+
+# pylint: disable=unused-argument
+def disconnected(client):
+    # Disconnected function will be called when the client disconnects.
+    print("Disconnected from Adafruit IO!")
+
+
+# pylint: disable=unused-argument
+def message(client, topic, payload):
+    # Message function will be called each time Adafruit IO generates new
+    # random data. The payload is the same JSON record the HTTP API returns.
+    random_data = json.loads(payload)
+    print("Random Data: ", random_data["value"])
+    print("Data Seed: ", random_data["seed"])
+
+
+# Create a socket pool
+pool = socketpool.SocketPool(wifi.radio)
+
+# Initialize a new MQTT Client object
+mqtt_client = MQTT.MQTT(
+    broker="io.adafruit.com",
+    port=8883,
+    username=secrets["aio_username"],
+    password=secrets["aio_key"],
+    socket_pool=pool,
+    ssl_context=ssl.create_default_context(),
+    is_ssl=True,
+)
+
+# Initialize an Adafruit IO MQTT Client
+io = IO_MQTT(mqtt_client)
+io.on_connect = connected
+io.on_disconnect = disconnected
+io.on_message = message
+
+# Connect to Adafruit IO
+print("Connecting to Adafruit IO...")
+io.connect()
+
+# Start a blocking loop to check for new messages
+while True:
+    try:
+        io.loop()
+    except (ValueError, RuntimeError) as e:
+        print("Failed to get data, retrying\n", e)
+        io.reconnect()
@@ -122,14 +122,20 @@ print("Connecting to Adafruit IO...")
 io.connect()
 
 # Below is an example of manually publishing a new  value to Adafruit IO.
+# Every uplink wakes the modem radio, so publish at a relaxed interval.
+PUBLISH_INTERVAL = 30
 last = 0
-print("Publishing a new message every 10 seconds...")
+print("Publishing a new message every %d seconds..." % PUBLISH_INTERVAL)
 while True:
     # Explicitly pump the message loop.
     io.loop()
-    # Send a new message every 10 seconds.
-    if (time.monotonic() - last) >= 5:
+    # Send a new message every PUBLISH_INTERVAL seconds, but only while the
+    # cellular data connection is up; otherwise wait for the next interval.
+    if (time.monotonic() - last) >= PUBLISH_INTERVAL:
+        last = time.monotonic()
+        if not gsm.is_connected:
+            print("Cellular network is down, skipping this publish.")
+            continue
         value = randint(0, 100)
         print("Publishing {0} to DemoFeed.".format(value))
         io.publish("DemoFeed", value)
-        last = time.monotonic()
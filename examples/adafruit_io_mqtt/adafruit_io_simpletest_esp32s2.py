@@ -5,6 +5,7 @@ from random import randint
 
 import os
 import ssl
+import microcontroller
 import socketpool
 import wifi
 import adafruit_minimqtt.adafruit_minimqtt as MQTT
@@ -94,12 +95,17 @@ def message(client, feed_id, payload):
 # Create a socket pool
 pool = socketpool.SocketPool(wifi.radio)
 
+# A persistent session is tied to the client ID, so use one that stays the
+# same across restarts of this board.
+cpu_uid = microcontroller.cpu.uid  # pylint: disable=no-member
+
 # Initialize a new MQTT Client object
 mqtt_client = MQTT.MQTT(
     broker="io.adafruit.com",
     port=8883,
     username=secrets["aio_username"],
     password=secrets["aio_key"],
+    client_id="io-simpletest-" + cpu_uid.hex(),
     socket_pool=pool,
     ssl_context=ssl.create_default_context(),
     is_ssl=True,
@@ -116,9 +122,10 @@ io.on_unsubscribe = unsubscribe
 io.on_message = message
 io.on_publish = publish
 
-# Connect to Adafruit IO
+# Connect to Adafruit IO, asking the broker to keep this client's session
+# (subscriptions and queued messages) if the connection drops
 print("Connecting to Adafruit IO...")
-io.connect()
+io.connect(clean_session=False)
 
 # Below is an example of manually publishing a new  value to Adafruit IO.
 last = 0
@@ -0,0 +1,113 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+# Example of streaming ADT7410 sensor temperature values to IO over MQTT.
+# One TLS connection stays open for the whole run, so each reading costs a
+# small MQTT PUBLISH instead of a full HTTPS request.
+import os
+import time
+import ssl
+import board
+import busio
+import socketpool
+import wifi
+import adafruit_minimqtt.adafruit_minimqtt as MQTT
+import adafruit_adt7410
+from adafruit_io.adafruit_io import IO_MQTT
+
+### WiFi ###
+
+# Add a secrets.py to your filesystem that has a dictionary called secrets with "ssid" and
+# "password" keys with your WiFi credentials. DO NOT share that file or commit it into Git or other
+# source control.
+# pylint: disable=no-name-in-module,wrong-import-order
+try:
+    if os.getenv("AIO_USERNAME") and os.getenv("AIO_KEY"):
+        secrets = {
+            "aio_username": os.getenv("AIO_USERNAME"),
+            "aio_key": os.getenv("AIO_KEY"),
+            "ssid": os.getenv("CIRCUITPY_WIFI_SSID"),
+            "password": os.getenv("CIRCUITPY_WIFI_PASSWORD"),
+        }
+    else:
+        from secrets import secrets
+except ImportError:
+    print(
+        "WiFi + Adafruit IO secrets are kept in secrets.py or settings.toml, please add them there!"
+    )
+    raise
+
+if not wifi.radio.connected:
+    print("Connecting to %s" % secrets["ssid"])
+    wifi.radio.connect(secrets["ssid"], secrets["password"])
+    print("Connected to %s!" % secrets["ssid"])
+
+
+# Define callback functions which will be called when certain events happen.
+# pylint: disable=unused-argument
+def connected(client):
+    # Connected function will be called when the client is connected to Adafruit IO.
+    print("Connected to Adafruit IO!")
+
+
+# pylint: disable=unused-argument
+def disconnected(client):
+    # Disconnected function will be called when the client disconnects.
+    print("Disconnected from Adafruit IO!")
+
+
+# Create a socket pool
+pool = socketpool.SocketPool(wifi.radio)
+
+# Initialize a new MQTT Client object. The socket timeout is kept at or
+# below the loop timeout used to pace the readings further down.
+mqtt_client = MQTT.MQTT(
+    broker="io.adafruit.com",
+    port=8883,
+    username=secrets["aio_username"],
+    password=secrets["aio_key"],
+    socket_pool=pool,
+    ssl_context=ssl.create_default_context(),
+    is_ssl=True,
+    socket_timeout=0.5,
+)
+
+# Initialize an Adafruit IO MQTT Client
+io = IO_MQTT(mqtt_client)
+io.on_connect = connected
+io.on_disconnect = disconnected
+
+# Set up ADT7410 sensor
+i2c_bus = busio.I2C(board.SCL, board.SDA)
+adt = adafruit_adt7410.ADT7410(i2c_bus, address=0x48)
+adt.high_resolution = True
+
+# Connect to Adafruit IO
+print("Connecting to Adafruit IO...")
+io.connect()
+
+# Only readings that moved at least this much (in *C) since the last one
+# published are sent, so a steady temperature sends almost nothing. A reading
+# is still sent every MAX_INTERVAL seconds to show the sensor is alive.
+TEMPERATURE_DELTA = 0.05
+MAX_INTERVAL = 300
+last_sent = None
+last_sent_time = 0
+
+while True:
+    temperature = adt.temperature
+    now = time.monotonic()
+    if (
+        last_sent is None
+        or abs(temperature - last_sent) >= TEMPERATURE_DELTA
+        or now - last_sent_time >= MAX_INTERVAL
+    ):
+        last_sent = temperature
+        last_sent_time = now
+        # set temperature value to two precision points
+        temperature = "%0.2f" % (temperature)
+        print("Current Temperature: {0}*C".format(temperature))
+        io.publish("temperature", temperature)
+    # Pump the message loop (this also sends keep-alive pings) while
+    # waiting half a second for the next reading
+    io.loop(timeout=0.5)